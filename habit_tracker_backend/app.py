@@ -19,17 +19,27 @@ Endpoints:
 
 The API enforces authentication on all habit‑related endpoints using Flask‑JWT‑
 Extended. CORS is enabled to allow cross‑origin requests from the Netlify
-front‑end. See README.md for deployment instructions.
+front‑end, unless CORS_HANDLED_BY_PROXY=1 delegates it to a reverse proxy.
+See README.md for deployment instructions.
 """
 
 from __future__ import annotations
 
+import json
 import os
+import random
+import threading
+import time
 from datetime import datetime, timedelta, date
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-import requests
+import orjson
+import redis
+import urllib3
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_jwt_extended import (
     JWTManager,
@@ -38,15 +48,30 @@ from flask_jwt_extended import (
     jwt_required,
 )
 from flask_sqlalchemy import SQLAlchemy
-from werkzeug.security import check_password_hash, generate_password_hash
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from werkzeug.security import check_password_hash
 
 
 ###########################
 # Application setup
 ###########################
 
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson, which is much faster than the stdlib
+    encoder for the lists of dicts returned by the habit endpoints. It is also
+    used by request.get_json() when parsing request bodies."""
+
+    def dumps(self, obj: object, **kwargs: object) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s: str | bytes, **kwargs: object) -> object:
+        return orjson.loads(s)
+
+
 # Create Flask app and configure database
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Use SQLite database by default. You can override with the DATABASE_URL
 # environment variable when deploying (e.g., to Postgres on Render).
@@ -68,17 +93,57 @@ app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "super-secret-jwt-key
 
 db = SQLAlchemy(app)
 jwt = JWTManager(app)
+
+
+def _sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    """Tune each new SQLite connection for concurrent reads and cheap commits.
+
+    WAL mode lets readers proceed while a writer commits, and synchronous=NORMAL
+    avoids a second fsync per commit, which is safe in WAL mode.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+with app.app_context():
+    if db.engine.dialect.name == "sqlite":
+        event.listen(db.engine, "connect", _sqlite_pragmas)
+
+# Optional Redis connection shared by all workers for caching. When REDIS_URL
+# is not set, response caching is skipped and the remote quote pool is only
+# kept in per-process memory. Short socket timeouts make an unreachable Redis
+# look like a cache miss instead of stalling workers on the OS TCP timeout.
+redis_url = os.getenv("REDIS_URL")
+redis_client = (
+    redis.Redis.from_url(
+        redis_url,
+        decode_responses=True,
+        socket_connect_timeout=0.2,
+        socket_timeout=0.2,
+    )
+    if redis_url
+    else None
+)
+
 # Configure CORS to allow all origins and expose the Authorization header so that
 # browsers can read it during preflight. Without exposing Authorization, some
 # browsers may fail to send the header correctly.
-
-cors = CORS(
-    app,
-    resources={r"/*": {"origins": "*"}},
-    expose_headers=["Authorization"],
-    allow_headers=["Content-Type", "Authorization"],
-    supports_credentials=False,
-)
+#
+# When a reverse proxy in front of Gunicorn already adds the CORS headers and
+# answers preflights, set CORS_HANDLED_BY_PROXY=1 to skip Flask-CORS and its
+# per-request after_request hook.
+if os.getenv("CORS_HANDLED_BY_PROXY") != "1":
+    CORS(
+        app,
+        resources={r"/*": {"origins": "*"}},
+        expose_headers=["Authorization"],
+        allow_headers=["Content-Type", "Authorization"],
+        supports_credentials=False,
+    )
 
 
 @app.before_request
@@ -90,7 +155,9 @@ def handle_preflight() -> None:
     errors on preflight requests, which would otherwise result in a 422 status.
     """
     if request.method == "OPTIONS":
-        # Flask-CORS will add the appropriate CORS headers
+        # Flask-CORS adds the appropriate CORS headers. With
+        # CORS_HANDLED_BY_PROXY=1 this response carries none, so the proxy is
+        # expected to add them or to answer OPTIONS itself.
         return "", 200
 
 
@@ -98,20 +165,41 @@ def handle_preflight() -> None:
 # Database models
 ###########################
 
+# Password hasher for new hashes. Werkzeug 3's default scrypt (N=32768, r=8)
+# takes well over 100 ms per verify and dominates /login latency. Argon2id
+# with the OWASP-recommended minimum parameters (19 MiB, 2 passes) is several
+# times cheaper per verify while remaining memory-hard. Older Werkzeug
+# hashes (scrypt, or PBKDF2 from pre-Werkzeug-3 deployments) are still
+# accepted and are rehashed on the next successful login.
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+
 class User(db.Model):
     __tablename__ = "users"
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128), nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     habit_entries = db.relationship("HabitEntry", back_populates="user", cascade="all, delete-orphan")
+    day_entries = db.relationship("DayEntry", back_populates="user", cascade="all, delete-orphan")
 
     def set_password(self, password: str) -> None:
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password: str) -> bool:
-        return check_password_hash(self.password_hash, password)
+        if not self.password_hash.startswith("$argon2"):
+            return check_password_hash(self.password_hash, password)
+        try:
+            return password_hasher.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def needs_rehash(self) -> bool:
+        """Return True if the stored hash uses another scheme or parameters."""
+        if not self.password_hash.startswith("$argon2"):
+            return True
+        return password_hasher.check_needs_rehash(self.password_hash)
 
 
 class Habit(db.Model):
@@ -123,6 +211,12 @@ class Habit(db.Model):
 
 
 class HabitEntry(db.Model):
+    """Legacy one-row-per-habit completion record, superseded by DayEntry.
+
+    Existing rows are folded into day_entries at startup by
+    migrate_habit_entries(); nothing writes to this table anymore.
+    """
+
     __tablename__ = "habit_entries"
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
@@ -133,15 +227,45 @@ class HabitEntry(db.Model):
     user = db.relationship("User", back_populates="habit_entries")
     habit = db.relationship("Habit", back_populates="entries")
 
+    # Legacy only: no handler reads this table anymore, and
+    # migrate_habit_entries() scans it in full once. The constraint and index
+    # are kept so the model still matches tables created by older deployments.
     __table_args__ = (
         db.UniqueConstraint("user_id", "habit_id", "date", name="user_habit_date_unique"),
+        db.Index("ix_habit_entries_user_date", "user_id", "date"),
     )
 
 
+class DayEntry(db.Model):
+    """All of a user's habit completions for one day, packed into a bitmap.
+
+    Bit i of ``bits`` is set when the habit at position i of the id-ordered
+    habit list (see get_cached_habits) was completed. Habits are only ever
+    appended, so positions are stable, and up to MAX_HABITS (63) habits fit in
+    a signed 64-bit integer.
+    """
+
+    __tablename__ = "day_entries"
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    bits = db.Column(db.BigInteger, nullable=False, default=0)
+
+    user = db.relationship("User", back_populates="day_entries")
+
+
 ###########################
 # Utility functions
 ###########################
 
+# (id, name) pairs for every habit, ordered by id. Habits are only created by
+# seed_habits() and never modified through the API, so the list is loaded once
+# per process instead of on every request.
+_HABITS_CACHE: List[Tuple[int, str]] = []
+
+# Each habit owns one bit of DayEntry.bits, a signed 64-bit integer.
+MAX_HABITS = 63
+
+
 def seed_habits() -> None:
     """Populate the habits table with the default list if it's empty."""
     default_habits = [
@@ -162,40 +286,233 @@ def seed_habits() -> None:
         "Walk",
     ]
     if Habit.query.count() == 0:
-        for name in default_habits:
-            db.session.add(Habit(name=name))
+        # Insert every default habit in a single executemany batch
+        db.session.bulk_insert_mappings(Habit, [{"name": name} for name in default_habits])
         db.session.commit()
+    # Reload the cached habit list from the (possibly just seeded) table
+    _HABITS_CACHE.clear()
+    get_cached_habits()
+
+
+def get_cached_habits() -> List[Tuple[int, str]]:
+    """Return the cached (id, name) habit list, loading it if necessary."""
+    if not _HABITS_CACHE:
+        _HABITS_CACHE[:] = [(habit.id, habit.name) for habit in Habit.query.order_by(Habit.id).all()]
+        if len(_HABITS_CACHE) > MAX_HABITS:
+            raise RuntimeError(
+                f"{len(_HABITS_CACHE)} habits exceed the {MAX_HABITS} that fit in DayEntry.bits"
+            )
+    return _HABITS_CACHE
 
 
-def get_quote() -> Dict[str, str]:
+def migrate_habit_entries() -> None:
+    """Fold legacy HabitEntry rows into DayEntry bitmaps.
+
+    Runs only while day_entries is still empty, so it is a one-off pass on the
+    first start after the schema change. Several workers may start at once and
+    all run it; rows another worker already wrote are skipped, so the losers
+    of that race simply continue.
     """
-    Fetch a random quote from the zenquotes.io API. If the API call fails,
-    return a fallback quote.
+    if DayEntry.query.first() is not None or HabitEntry.query.first() is None:
+        return
+    positions = {habit_id: i for i, (habit_id, _name) in enumerate(get_cached_habits())}
+    days: Dict[Tuple[int, date], int] = {}
+    rows = HabitEntry.query.with_entities(
+        HabitEntry.user_id, HabitEntry.date, HabitEntry.habit_id, HabitEntry.completed
+    ).all()
+    for user_id, day, habit_id, completed in rows:
+        bits = days.get((user_id, day), 0)
+        if completed and habit_id in positions:
+            bits |= 1 << positions[habit_id]
+        days[(user_id, day)] = bits
+    stmt = upsert_insert(DayEntry).on_conflict_do_nothing(index_elements=["user_id", "date"])
+    db.session.execute(
+        stmt,
+        [{"user_id": user_id, "date": day, "bits": bits} for (user_id, day), bits in days.items()],
+    )
+    db.session.commit()
 
-    Returns a dictionary with keys 'quote' and 'author'.
+
+# Cached /habits responses only change when the same user saves, so they can
+# live long. /progress spans several days and is kept briefly. Both are keyed
+# by a per-user generation that every save bumps: a GET that read the database
+# before a concurrent save committed stores its (stale) body under the old
+# generation, where no later request looks it up.
+HABITS_CACHE_TTL = 86400  # seconds
+PROGRESS_CACHE_TTL = 300  # seconds
+
+
+def cache_generation(user_id: int, bump: bool = False) -> Optional[int]:
+    """Return the user's cache generation, incrementing it first if bump is set.
+
+    Returns None when Redis is not configured or unreachable, in which case
+    callers skip the cache entirely.
     """
+    if redis_client is None:
+        return None
+    key = f"cache_gen:{user_id}"
+    try:
+        return int(redis_client.incr(key) if bump else redis_client.get(key) or 0)
+    except redis.RedisError:
+        return None
+
+
+def cache_load(key: str, field: Optional[str] = None) -> Optional[object]:
+    """Return the JSON value cached in Redis under key (or a hash field)."""
+    if redis_client is None:
+        return None
     try:
-        response = requests.get("https://zenquotes.io/api/random", timeout=5)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list) and data:
-            q = data[0].get("q")
-            a = data[0].get("a")
-            return {"quote": q, "author": a}
-    except Exception:
+        raw = redis_client.get(key) if field is None else redis_client.hget(key, field)
+    except redis.RedisError:
+        return None
+    return orjson.loads(raw) if raw else None
+
+
+def cache_store(key: str, value: object, ttl: int, field: Optional[str] = None) -> None:
+    """Cache a JSON-serializable value in Redis under key (or a hash field)."""
+    if redis_client is None:
+        return
+    payload = orjson.dumps(value)
+    try:
+        if field is None:
+            redis_client.setex(key, ttl, payload)
+        else:
+            pipe = redis_client.pipeline()
+            pipe.hset(key, field, payload)
+            pipe.expire(key, ttl)
+            pipe.execute()
+    except redis.RedisError:
         pass
+
+
+# /quote is served from a bundled list of quotes loaded at import time, so the
+# common case involves no I/O at all. Set USE_REMOTE_QUOTES=1 to fetch quotes
+# from zenquotes.io instead; those are cached in Redis (when configured) so
+# that all workers share a single upstream call per TTL window, and in-process
+# so most /quote requests are served from memory.
+USE_REMOTE_QUOTES = os.getenv("USE_REMOTE_QUOTES") == "1"
+with open(os.path.join(os.path.dirname(__file__), "quotes.json"), encoding="utf-8") as f:
+    _QUOTES: List[Dict[str, str]] = json.load(f)
+QUOTE_CACHE_TTL = 300  # seconds
+QUOTE_RETRY_BACKOFF = 30  # seconds to wait after a failed refresh
+QUOTE_POOL_KEY = "quote:pool"
+FALLBACK_QUOTE = {
+    "quote": "Every day is a new opportunity to improve yourself."
+    " Be mindful, grateful, and purposeful.",
+    "author": "Unknown",
+}
+_QUOTE_CACHE: List[Dict[str, str]] = []
+_QUOTE_REFRESH_AT = 0.0  # monotonic time of the next allowed refresh
+_QUOTE_LOCK = threading.Lock()
+
+# Shared urllib3 pool so upstream calls reuse keep-alive connections instead
+# of paying a TCP and TLS handshake every time. urllib3 is used directly to
+# skip the per-call overhead of the requests adapter chain.
+_HTTP = urllib3.PoolManager(
+    maxsize=4,
+    retries=urllib3.Retry(total=2, backoff_factor=0.1),
+    timeout=urllib3.Timeout(connect=2, read=3),
+)
+
+
+def fetch_quotes() -> List[Dict[str, str]]:
+    """Fetch a batch of quotes (currently 50) from the zenquotes.io API."""
+    response = _HTTP.request("GET", "https://zenquotes.io/api/quotes")
+    if response.status >= 400:
+        raise urllib3.exceptions.HTTPError(f"zenquotes.io returned HTTP {response.status}")
+    data = orjson.loads(response.data)
+    if not isinstance(data, list):
+        return []
+    return [
+        {"quote": item.get("q"), "author": item.get("a")}
+        for item in data
+        if isinstance(item, dict) and item.get("q")
+    ]
+
+
+def load_quote_pool() -> List[Dict[str, str]]:
+    """Return the shared quote pool from Redis, fetching it upstream on a miss."""
+    cached = cache_load(QUOTE_POOL_KEY)
+    if cached:
+        return cached
+    quotes = fetch_quotes()
+    if quotes:
+        cache_store(QUOTE_POOL_KEY, quotes, QUOTE_CACHE_TTL)
+    return quotes
+
+
+def get_quote() -> Dict[str, str]:
+    """
+    Return a random quote from the bundled list, or from the remote pool when
+    USE_REMOTE_QUOTES is enabled.
+
+    Returns a dictionary with keys 'quote' and 'author'.
+    """
+    if not USE_REMOTE_QUOTES:
+        return random.choice(_QUOTES)
+    return get_remote_quote()
+
+
+def get_remote_quote() -> Dict[str, str]:
+    """
+    Return a random quote from the cached pool, refreshing the pool from Redis
+    or the zenquotes.io API once it is older than QUOTE_CACHE_TTL. If the
+    refresh fails, the stale pool (or, when there is none, a fallback quote)
+    is served and no new attempt is made for QUOTE_RETRY_BACKOFF seconds.
+
+    Returns a dictionary with keys 'quote' and 'author'.
+    """
+    global _QUOTE_REFRESH_AT
+    # Only one thread refreshes the pool at a time. The others do not wait for
+    # it and serve whatever is cached, so a slow or failing upstream never
+    # queues requests behind the lock.
+    if time.monotonic() >= _QUOTE_REFRESH_AT and _QUOTE_LOCK.acquire(blocking=False):
+        try:
+            if time.monotonic() >= _QUOTE_REFRESH_AT:
+                try:
+                    quotes = load_quote_pool()
+                except Exception:
+                    quotes = []
+                if quotes:
+                    _QUOTE_CACHE[:] = quotes
+                    _QUOTE_REFRESH_AT = time.monotonic() + QUOTE_CACHE_TTL
+                else:
+                    _QUOTE_REFRESH_AT = time.monotonic() + QUOTE_RETRY_BACKOFF
+        finally:
+            _QUOTE_LOCK.release()
+    if _QUOTE_CACHE:
+        return random.choice(_QUOTE_CACHE)
     # Fallback quote in case of network failure
-    return {
-        "quote": "Every day is a new opportunity to improve yourself."
-        " Be mindful, grateful, and purposeful.",
-        "author": "Unknown",
-    }
+    return dict(FALLBACK_QUOTE)
+
+
+def upsert_insert(model: type[db.Model]):
+    """Return a dialect-specific INSERT construct supporting ON CONFLICT.
+
+    SQLite is used by default, but DATABASE_URL may point at Postgres, so pick
+    the insert() of whichever dialect the engine is bound to.
+    """
+    if db.engine.dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
 
 
 def parse_date(date_str: str) -> date:
-    """Parse a YYYY-MM-DD string into a date object."""
+    """Parse a YYYY-MM-DD string into a date object.
+
+    The fixed layout is sliced directly rather than going through strptime,
+    which re-parses the format string and builds a datetime on every call.
+    """
+    if (
+        not isinstance(date_str, str)
+        or len(date_str) != 10
+        or date_str[4] != "-"
+        or date_str[7] != "-"
+        or not (date_str[0:4] + date_str[5:7] + date_str[8:10]).isdigit()
+    ):
+        raise ValueError("Date must be in YYYY-MM-DD format")
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
+        return date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
     except ValueError:
         raise ValueError("Date must be in YYYY-MM-DD format")
 
@@ -212,6 +529,7 @@ def parse_date(date_str: str) -> date:
 with app.app_context():
     db.create_all()
     seed_habits()
+    migrate_habit_entries()
 
 
 @app.route("/register", methods=["POST"])
@@ -228,7 +546,7 @@ def register() -> tuple[Dict[str, str], int]:
     password = data.get("password", "")
     if not username or not password:
         return {"error": "Username and password are required."}, 400
-    if User.query.filter_by(username=username).first():
+    if db.session.execute(db.select(User.id).filter_by(username=username)).first():
         return {"error": "Username already exists."}, 409
     user = User(username=username)
     user.set_password(password)
@@ -251,6 +569,11 @@ def login() -> tuple[Dict[str, str], int]:
     user = User.query.filter_by(username=username).first()
     if user is None or not user.check_password(password):
         return {"error": "Invalid username or password."}, 401
+    # Migrate users hashed with the old PBKDF2 scheme now that we know the
+    # plaintext password.
+    if user.needs_rehash():
+        user.set_password(password)
+        db.session.commit()
     token = create_access_token(identity=user.id)
     return {"access_token": token}, 200
 
@@ -283,30 +606,33 @@ def get_habits() -> Dict[str, List[Dict[str, object]]]:
             return {"error": str(e)}, 400
     else:
         target_date = date.today()
-    # Ensure the habits table is seeded. If the database is empty for any reason
-    # (for example, if the initialization did not run), seed the default habits
-    # before retrieving them.
-    if Habit.query.count() == 0:
-        seed_habits()
-    # Retrieve all habits
-    habits = Habit.query.order_by(Habit.id).all()
+    generation = cache_generation(user_id) if user_id is not None else None
+    cache_key = f"habits:{user_id}:{generation}:{target_date.isoformat()}"
+    if generation is not None:
+        cached = cache_load(cache_key)
+        if cached is not None:
+            return cached
+    # Retrieve all habits. They are seeded once at startup, so there is no
+    # need to check the table on every request.
+    habits = get_cached_habits()
     result: List[Dict[str, object]] = []
     # If a user is logged in (user_id is not None), fetch their completion
-    # records for the target date. Otherwise, default all completions to False.
-    entries_by_habit: Dict[int, HabitEntry] = {}
+    # bitmap for the target date. Otherwise, default all completions to False.
+    bits = 0
     if user_id is not None:
-        entries_by_habit = {
-            entry.habit_id: entry
-            for entry in HabitEntry.query.filter_by(user_id=user_id, date=target_date).all()
-        }
-    for habit in habits:
-        entry = entries_by_habit.get(habit.id)
+        bits = db.session.execute(
+            db.select(DayEntry.bits).filter_by(user_id=user_id, date=target_date)
+        ).scalar() or 0
+    for i, (habit_id, name) in enumerate(habits):
         result.append({
-            "id": habit.id,
-            "name": habit.name,
-            "completed": bool(entry.completed) if entry else False,
+            "id": habit_id,
+            "name": name,
+            "completed": bool(bits >> i & 1),
         })
-    return {"date": target_date.isoformat(), "habits": result}
+    response = {"date": target_date.isoformat(), "habits": result}
+    if generation is not None:
+        cache_store(cache_key, response, HABITS_CACHE_TTL)
+    return response
 
 
 @app.route("/habits", methods=["POST"])
@@ -319,7 +645,7 @@ def save_habits() -> tuple[Dict[str, object], int]:
         - date: YYYY-MM-DD string
         - completions: a dict mapping habit IDs (as strings) to booleans
 
-    Creates or updates HabitEntry records for the given date. Returns the
+    Creates or updates the DayEntry record for the given date. Returns the
     completion percentage (number of completed habits / total habits * 100).
     """
     user_id = get_jwt_identity()
@@ -334,26 +660,34 @@ def save_habits() -> tuple[Dict[str, object], int]:
         return {"error": str(e)}, 400
 
     # Ensure all habits exist
-    habits = Habit.query.order_by(Habit.id).all()
-    habit_ids = {habit.id for habit in habits}
-    # Update or create entries
+    habits = get_cached_habits()
+    # Normalize the payload once so habit IDs can be looked up as integers.
+    # JSON object keys always arrive as strings; only plain ASCII decimal keys
+    # are accepted (int() parses those unconditionally), anything else is
+    # ignored.
+    completed_ids = {
+        int(k)
+        for k, v in completions.items()
+        if v and isinstance(k, str) and k.isascii() and k.isdecimal()
+    }
+    # Pack the day's completions into one bitmap
     completed_count = 0
-    for habit in habits:
-        completed = bool(completions.get(str(habit.id)) or completions.get(habit.id))
-        entry = HabitEntry.query.filter_by(user_id=user_id, habit_id=habit.id, date=target_date).first()
-        if entry:
-            entry.completed = completed
-        else:
-            entry = HabitEntry(
-                user_id=user_id,
-                habit_id=habit.id,
-                date=target_date,
-                completed=completed,
-            )
-            db.session.add(entry)
-        if completed:
+    bits = 0
+    for i, (habit_id, _name) in enumerate(habits):
+        if habit_id in completed_ids:
+            bits |= 1 << i
             completed_count += 1
+    # Create or replace the day's row in a single statement
+    stmt = upsert_insert(DayEntry).values(user_id=user_id, date=target_date, bits=bits)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "date"],
+        set_={"bits": stmt.excluded.bits},
+    )
+    db.session.execute(stmt)
     db.session.commit()
+    # Every cached /habits body and /progress result for the user may now be
+    # stale; moving to a new generation makes them unreachable.
+    cache_generation(user_id, bump=True)
     percentage = (completed_count / len(habits) * 100) if habits else 0
     return {"message": "Habits saved.", "percentage": percentage}, 200
 
@@ -387,46 +721,47 @@ def progress() -> Dict[str, object]:
         start_date = end_date - timedelta(days=29)
     else:
         return {"error": "Period must be 'weekly' or 'monthly'."}, 400
-
-    # Build a map for each habit
-    habits = Habit.query.order_by(Habit.id).all()
-    habit_stats = {
-        habit.id: {
-            "id": habit.id,
-            "name": habit.name,
-            "completed_days": 0,
-            "total_days": 0,
-        }
-        for habit in habits
-    }
-
-    # Count entries per day
-    current_date = start_date
-    while current_date <= end_date:
-        # For each day, get entries for user
-        entries = HabitEntry.query.filter_by(user_id=user_id, date=current_date).all()
-        entries_map = {entry.habit_id: entry.completed for entry in entries}
-        for habit in habits:
-            stats = habit_stats[habit.id]
-            stats["total_days"] += 1
-            if entries_map.get(habit.id):
-                stats["completed_days"] += 1
-        current_date += timedelta(days=1)
-
-    # Compute percentages
-    for stats in habit_stats.values():
-        if stats["total_days"] > 0:
-            stats["percentage"] = round(
-                stats["completed_days"] / stats["total_days"] * 100, 2
-            )
-        else:
-            stats["percentage"] = 0.0
-    return {
+    # Cached results for a user generation live in one hash
+    generation = cache_generation(user_id)
+    cache_key = f"progress:{user_id}:{generation}"
+    cache_field = f"{period}:{end_date.isoformat()}"
+    if generation is not None:
+        cached = cache_load(cache_key, cache_field)
+        if cached is not None:
+            return cached
+
+    # Every habit is counted on every day of the period, so total_days is the
+    # same for all of them.
+    total_days = (end_date - start_date).days + 1
+
+    # Fetch the at most one bitmap per day of the period
+    day_bits = db.session.execute(
+        db.select(DayEntry.bits).where(
+            DayEntry.user_id == user_id,
+            DayEntry.date.between(start_date, end_date),
+        )
+    ).scalars().all()
+
+    # Count the days on which each habit's bit is set
+    habit_stats: List[Dict[str, object]] = []
+    for i, (habit_id, name) in enumerate(get_cached_habits()):
+        completed_days = sum(bits >> i & 1 for bits in day_bits)
+        habit_stats.append({
+            "id": habit_id,
+            "name": name,
+            "completed_days": completed_days,
+            "total_days": total_days,
+            "percentage": round(completed_days / total_days * 100, 2),
+        })
+    response = {
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
         "period": period,
-        "habits": list(habit_stats.values()),
+        "habits": habit_stats,
     }
+    if generation is not None:
+        cache_store(cache_key, response, PROGRESS_CACHE_TTL, cache_field)
+    return response
 
 
 if __name__ == "__main__":